@@ -2,119 +2,341 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
-from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
-from rich.markdown import Markdown
+from rich.spinner import Spinner
+from rich.text import Text
 from rich import box
 from typing import List, Dict, Optional, Literal
+from contextlib import contextmanager
 import time
 import datetime
 import json
+import shutil
+import collections
+import operator
 from pathlib import Path
 import msvcrt
 import signal
+import threading
+import ctypes
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+else:
+    def _json_dumps(obj) -> bytes:
+        """Serialize compactly to UTF-8 bytes, matching the orjson interface"""
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, default=datetime.datetime.isoformat
+        ).encode('utf-8')
+
+STD_INPUT_HANDLE = -10
+WAIT_OBJECT_0 = 0
+CTRL_CLOSE_EVENT = 2
+# Upper bound on a single blocking wait so pending signal handlers still get to run
+INPUT_WAIT_MS = 250
+
+_kernel32 = ctypes.windll.kernel32
+_kernel32.GetStdHandle.restype = ctypes.c_void_p
+_kernel32.GetConsoleMode.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_ulong)]
+_kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+_kernel32.WaitForSingleObject.restype = ctypes.c_ulong
+_kernel32.FlushConsoleInputBuffer.argtypes = [ctypes.c_void_p]
+_HANDLER_ROUTINE = ctypes.WINFUNCTYPE(ctypes.c_int, ctypes.c_ulong)
+_kernel32.SetConsoleCtrlHandler.argtypes = [_HANDLER_ROUTINE, ctypes.c_int]
+
+def _get_console_input_handle() -> Optional[int]:
+    """Return the waitable console input handle, or None if stdin is not a console"""
+    handle = _kernel32.GetStdHandle(STD_INPUT_HANDLE)
+    mode = ctypes.c_ulong()
+    if not handle or not _kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return None
+    return handle
 
 class AutomationUI:
-    def __init__(self):
+    # Pre-styled (icon prefix, message style) for each level, so no markup is parsed per message
+    _MESSAGE_STYLES = {
+        "success": (Text.assemble(("✓", "bold green"), " "), "green"),
+        "error": (Text.assemble(("✗", "bold red"), " "), "red"),
+        "warning": (Text.assemble(("!", "bold yellow"), " "), "yellow"),
+        "info": (Text.assemble(("i", "bold blue"), " "), "blue")
+    }
+    # Every session_logs entry has exactly these keys; see log_event
+    _LOG_ENTRY_FIELDS = operator.itemgetter("ts_ns", "step", "event", "details")
+    _KEY_ACTIONS = {
+        '\r': "proceed",  # Enter key
+        'h': "help",
+        'q': "exit",
+        'l': "logs",
+        'r': "retry",
+        's': "summary"
+    }
+    # Raw getch() byte -> action, so keystrokes skip decoding and case folding
+    _KEY_TABLE = tuple(map(_KEY_ACTIONS.get, [chr(code).lower() for code in range(256)]))
+    # getch() returns one of these first for arrow and function keys, then a scan code
+    _EXTENDED_KEY_PREFIXES = (b'\x00', b'\xe0')
+
+    def __init__(self, max_log_entries: Optional[int] = 10_000, persist_logs: bool = False):
         """Initialize the AutomationUI with basic setup"""
         self.console = Console()
         self.current_step = 0
-        self.session_logs = []
-        self.session_start_time = datetime.datetime.now()
+        # Oldest events are dropped once max_log_entries is reached (None keeps all)
+        self.session_logs = collections.deque(maxlen=max_log_entries)
+        self._session_start_ns = time.time_ns()
+        self.session_start_time = datetime.datetime.fromtimestamp(self._session_start_ns / 1e9)
         self.is_running = True
+        self._interrupt_signal: Optional[int] = None  # Set by handle_interrupt, reported by cleanup
+        self._stop_event = threading.Event()  # Set on shutdown to cut short any pending wait
+        self._log_lock = threading.Lock()  # Guards the NDJSON stream against the close handler thread
         self.step_history = []  # Track step execution history
+        self._console_input = _get_console_input_handle()
+        self._header_panel = Panel(
+            "[bold blue]🤖 Interactive Automation Assistant[/]\n"
+            "[dim]Human-in-the-loop process automation[/]",
+            box=box.DOUBLE,
+            style="bold white on blue",
+            padding=(1, 2)
+        )
+        # Rendered panels keyed by the step fields they display, reused across retries
+        self._panel_cache: Dict[tuple, Panel] = {}
+        self._help_cache: Dict[tuple, Panel] = {}
+        self._action_menu_table = Table(show_header=False, show_edge=False, box=box.SIMPLE)
+        self._action_menu_table.add_column("Action", style="cyan")
+        self._action_menu_table.add_column("Description", style="dim")
+        for action, desc in [
+            ("▶️ [green]proceed", "Continue to next step (Enter)"),
+            ("🔄 [yellow]retry", "Retry current step (r)"),
+            ("❓ [blue]help", "Get help with current step (h)"),
+            ("📝 [magenta]logs", "Export session logs (l)"),
+            ("❌ [bold red]exit", "Exit automation (q)")
+        ]:
+            self._action_menu_table.add_row(action, desc)
+        self._shortcuts_panel = Panel(
+            "\n".join([
+                "[bold cyan]Available Commands:[/]",
+                "",
+                "[yellow]Enter[/] Next step / Proceed",
+                "[yellow]h[/] Show help",
+                "[yellow]q[/] Quit",
+                "[yellow]l[/] Export logs",
+                "[yellow]r[/] Retry current step",
+                "[yellow]s[/] Show summary"
+            ]),
+            title="[bold]Command Guide[/]",
+            border_style="blue"
+        )
+        self._export_options_table = Table(show_header=False, box=box.SIMPLE)
+        self._export_options_table.add_column("Format", style="cyan")
+        self._export_options_table.add_column("Description", style="dim")
+        self._export_options_table.add_row("📄 text", "Human-readable text format")
+        self._export_options_table.add_row("🔧 json", "Machine-readable JSON format")
+        self._export_formats = ["text", "json"]
+        if persist_logs:
+            self._export_options_table.add_row("📜 ndjson", "Raw log entries (ts_ns timestamps), one JSON object per line")
+            self._export_formats.append("ndjson")
+        # Screen regions updated in place while run_automation's live display is active.
+        # The header is compact and the menu edgeless so the output region keeps some
+        # rows on a standard 80x24 console; the step region is sized to its panel.
+        self._layout = Layout(name="root")
+        self._layout.split_column(
+            Layout(
+                Panel(self._header_panel.renderable, box=box.DOUBLE, style="bold white on blue", padding=(0, 2)),
+                name="header", size=4
+            ),
+            Layout("", name="step", size=0),
+            Layout(self._action_menu_table, name="menu", size=5),
+            Layout("", name="output", minimum_size=3)
+        )
+        self._live: Optional[Live] = None
+        # Append-only NDJSON copy of every event, so ndjson exports are a file copy
+        self._ndjson_fp = None
+        if persist_logs:
+            log_dir = Path("logs")
+            log_dir.mkdir(exist_ok=True)
+            session_ts = self.session_start_time.strftime("%Y%m%d_%H%M%S_%f")
+            # 'x' so a session never appends to another session's stream
+            self._ndjson_fp = open(log_dir / f"session_{session_ts}.ndjson", 'xb', buffering=1 << 16)
         self.setup_signal_handlers()
         self.log_event("Session started")
         
     def log_event(self, event: str, details: dict = None):
         """Log an event with timestamp and optional details"""
+        # Timestamps stay as raw nanoseconds until export
         log_entry = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "ts_ns": time.time_ns(),
             "event": event,
             "step": self.current_step + 1,
-            "details": details or {}
+            "details": details
         }
         self.session_logs.append(log_entry)
+        if self._ndjson_fp is not None:
+            line = _json_dumps(log_entry) + b"\n"  # Raw entry; no datetime work per event
+            with self._log_lock:
+                if self._ndjson_fp is not None:  # May have been closed by _ctrl_handler
+                    self._ndjson_fp.write(line)
     
     def setup_signal_handlers(self):
         """Setup handlers for graceful shutdown"""
         signal.signal(signal.SIGINT, self.handle_interrupt)
-        signal.signal(signal.SIGTERM, self.handle_interrupt)
+        signal.signal(signal.SIGBREAK, self.handle_interrupt)  # Ctrl+Break
+        # Windows never delivers SIGTERM to console apps; closing the window arrives
+        # as a console control event instead
+        self._ctrl_handler_routine = _HANDLER_ROUTINE(self._ctrl_handler)  # Keep alive for ctypes
+        _kernel32.SetConsoleCtrlHandler(self._ctrl_handler_routine, True)
+
+    def _ctrl_handler(self, event_type: int) -> bool:
+        """Handle the console being closed, which Python doesn't turn into a signal"""
+        if event_type != CTRL_CLOSE_EVENT:
+            return False  # Ctrl+C and Ctrl+Break reach the signal handlers on the main thread
+        # Runs on a thread Windows creates and the console is going away, so don't
+        # prompt or touch the display; just stop waiting and save what was logged
+        self.is_running = False
+        self._stop_event.set()
+        self._close_log_stream()
+        return True
     
     def handle_interrupt(self, signum, frame):
         """Handle interrupt signals gracefully"""
+        # Only flag the shutdown: this can run mid-export while the log lock is held,
+        # so the waits return on _stop_event and run_automation's cleanup does the rest
+        self._interrupt_signal = signum
         self.is_running = False
-        self.print_message("\nGracefully shutting down...", "warning")
-        self.cleanup()
+        self._stop_event.set()
     
+    def _render(self, renderable, region: str):
+        """Update a region of the live display, or print directly when it isn't running"""
+        if self._live is None:
+            self.console.print(renderable)
+        else:
+            self._layout[region].update(renderable)
+
+    @contextmanager
+    def _live_paused(self):
+        """Temporarily leave the live display so prompts can use the terminal"""
+        live = self._live
+        if live is None:
+            yield
+            return
+        live.stop()
+        try:
+            yield
+        finally:
+            live.start()
+
     def show_keyboard_shortcuts(self):
         """Display available keyboard shortcuts"""
-        shortcuts_panel = Panel(
-            "\n".join([
-                "[bold cyan]Available Commands:[/]",
-                "",
-                "[yellow]Enter[/] Next step / Proceed",
-                "[yellow]h[/] Show help",
-                "[yellow]q[/] Quit",
-                "[yellow]l[/] Export logs",
-                "[yellow]r[/] Retry current step",
-                "[yellow]s[/] Show summary"
-            ]),
-            title="[bold]Command Guide[/]",
-            border_style="blue"
-        )
-        self.console.print(shortcuts_panel)
+        self.console.print(self._shortcuts_panel)
     
-    def check_keyboard_input(self) -> Optional[str]:
-        """Check for keyboard input without blocking (Windows-compatible)"""
-        if msvcrt.kbhit():
-            key = msvcrt.getch().decode('utf-8').lower()
-            actions = {
-                '\r': "proceed",  # Enter key
-                'h': "help",
-                'q': "exit",
-                'l': "logs",
-                'r': "retry",
-                's': "summary"
-            }
-            return actions.get(key)
+    def check_keyboard_input(self, timeout_ms: int = 0) -> Optional[str]:
+        """Check for keyboard input, waiting up to timeout_ms for a key (Windows-compatible)"""
+        if self._wait_for_key(timeout_ms):
+            key = msvcrt.getch()
+            if key in self._EXTENDED_KEY_PREFIXES:
+                msvcrt.getch()  # Discard the scan code so it isn't read as a letter
+                return None
+            return self._KEY_TABLE[key[0]]
         return None
+
+    def _wait_for_key(self, timeout_ms: int) -> bool:
+        """Wait up to timeout_ms for a keypress, using the best available API"""
+        if self._console_input is None:
+            return self._wait_for_key_poll(timeout_ms)
+        return self._wait_for_key_console(timeout_ms)
+
+    def _wait_for_key_console(self, timeout_ms: int) -> bool:
+        """Block on the console input handle instead of polling"""
+        if _kernel32.WaitForSingleObject(self._console_input, timeout_ms) != WAIT_OBJECT_0:
+            return False
+        if msvcrt.kbhit():
+            return True
+        # Signalled by a non-character event (key release, mouse, focus); discard it
+        # so the next wait blocks again instead of returning immediately
+        _kernel32.FlushConsoleInputBuffer(self._console_input)
+        return False
+
+    def _wait_for_key_poll(self, timeout_ms: int) -> bool:
+        """Fallback for when stdin is not a console: poll msvcrt.kbhit"""
+        deadline = time.monotonic() + timeout_ms / 1000
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)  # Small delay to prevent CPU spinning
+        return True
+
+    def wait_for_keypress(self, seconds: Optional[float] = None) -> bool:
+        """Pause for up to `seconds` (or indefinitely), returning early on any keypress or on shutdown"""
+        deadline = None if seconds is None else time.monotonic() + seconds
+        while not self._stop_event.is_set():
+            wait_ms = INPUT_WAIT_MS
+            if deadline is not None:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    return False
+                wait_ms = min(remaining_ms, INPUT_WAIT_MS)
+            if self._wait_for_key(wait_ms):
+                self.check_keyboard_input()  # Consume the key so it isn't taken as a menu action
+                return True
+        return False
+
+    def _wait_for_stop(self, seconds: float) -> bool:
+        """Sleep for up to `seconds`, returning True early if shutdown begins"""
+        # Slice the wait: before Python 3.14 a Windows lock wait isn't interrupted by
+        # Ctrl+C, so a single long wait would delay the SIGINT handler until it ends
+        deadline = time.monotonic() + seconds
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._stop_event.wait(min(remaining, INPUT_WAIT_MS / 1000))
+        return True
     
     def print_message(self, message: str, level: Literal["success", "error", "warning", "info"] = "info"):
         """Print a message with appropriate color coding based on level"""
-        styles = {
-            "success": "[bold green]✓[/] [green]{}[/]",
-            "error": "[bold red]✗[/] [red]{}[/]",
-            "warning": "[bold yellow]![/] [yellow]{}[/]",
-            "info": "[bold blue]i[/] [blue]{}[/]"
-        }
-        formatted_message = styles.get(level, "{}").format(message)
-        self.console.print(formatted_message)
-        self.log_event(f"Message displayed", {"message": message, "level": level})
+        styles = self._MESSAGE_STYLES.get(level)
+        if styles is None:
+            self._render(message, "output")
+            return
+        prefix, style = styles
+        formatted_message = prefix.copy()
+        formatted_message.append(message, style=style)
+        self._render(formatted_message, "output")
 
     def cleanup(self):
         """Perform cleanup operations before exit"""
+        if self._interrupt_signal is not None:
+            self.print_message("\nGracefully shutting down...", "warning")
+            self.log_event("Interrupt received", {"signal": self._interrupt_signal})
         if self.session_logs:
-            if Confirm.ask("[cyan]Would you like to save the session logs before exiting?"):
+            from rich.prompt import Confirm
+            with self._live_paused():
+                save_logs = Confirm.ask("[cyan]Would you like to save the session logs before exiting?")
+            if save_logs:
                 self.show_export_options()
         self.print_message("Cleanup completed", "info")
+        self.log_event("Cleanup completed")
+        self._close_log_stream()
+
+    def _close_log_stream(self):
+        """Flush and close the NDJSON log stream, if one is open"""
+        with self._log_lock:
+            if self._ndjson_fp is not None:
+                self._ndjson_fp.close()
+                self._ndjson_fp = None
 
     def show_export_options(self):
         """Display and handle log export options"""
-        table = Table(show_header=False, box=box.SIMPLE)
-        table.add_column("Format", style="cyan")
-        table.add_column("Description", style="dim")
-        
-        table.add_row("📄 text", "Human-readable text format")
-        table.add_row("🔧 json", "Machine-readable JSON format")
-        
-        self.console.print(table)
-        format_choice = Prompt.ask(
-            "[bold cyan]Choose export format",
-            choices=["text", "json"],
-            default="text"
-        )
+        from rich.prompt import Prompt
+        with self._live_paused():
+            self.console.print(self._export_options_table)
+            format_choice = Prompt.ask(
+                "[bold cyan]Choose export format",
+                choices=self._export_formats,
+                default="text"
+            )
         self.export_logs(format_choice)
 
     def export_logs(self, format: str = "text") -> bool:
@@ -123,17 +345,27 @@ class AutomationUI:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             if format == "text":
                 filename = f"automation_logs_{timestamp}.txt"
-                content = self._format_logs_as_text()
+                stream_logs = self._stream_logs_as_text
+            elif format == "ndjson":
+                filename = f"automation_logs_{timestamp}.ndjson"
+                stream_logs = self._stream_logs_as_ndjson
             else:  # json format
                 filename = f"automation_logs_{timestamp}.json"
-                content = self._format_logs_as_json()
+                stream_logs = self._stream_logs_as_json
                 
             log_dir = Path("logs")
             log_dir.mkdir(exist_ok=True)
             log_path = log_dir / filename
             
-            with open(log_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with self._log_lock:
+                copied = format == "ndjson" and self._ndjson_fp is not None
+                if copied:  # Already on disk, so exporting is a file copy
+                    self._ndjson_fp.flush()
+                    shutil.copyfile(self._ndjson_fp.name, log_path)
+            if not copied:
+                with open(log_path, 'wb', buffering=1 << 16) as fp:
+                    stream_logs(fp)
+                    fp.flush()
                 
             self.print_message(f"Logs exported successfully to {log_path}", "success")
             self.log_event("Logs exported", {"filename": str(log_path)})
@@ -144,43 +376,64 @@ class AutomationUI:
             self.log_event("Log export failed", {"error": str(e)})
             return False
 
-    def _format_logs_as_text(self) -> str:
-        """Format logs as human-readable text"""
-        lines = [f"Automation Session Log - Started at {self.session_start_time}"]
-        lines.append("=" * 80)
+    def _stream_logs_as_text(self, fp):
+        """Write logs to a binary file as human-readable text"""
+        fp.writelines(line.encode('utf-8') for line in self._iter_text_lines())
+
+    def _iter_text_lines(self):
+        """Yield the human-readable log one newline-terminated line at a time"""
+        yield f"Automation Session Log - Started at {self.session_start_time}\n"
+        yield "=" * 80 + "\n"
         
-        for entry in self.session_logs:
-            timestamp = datetime.datetime.fromisoformat(entry["timestamp"])
-            formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            lines.append(f"\n[{formatted_time}] Step {entry['step']}: {entry['event']}")
-            if entry["details"]:
-                for key, value in entry["details"].items():
-                    lines.append(f"  {key}: {value}")
-                    
-        return "\n".join(lines)
-
-    def _format_logs_as_json(self) -> str:
-        """Format logs as JSON"""
-        log_data = {
-            "session_start": self.session_start_time.isoformat(),
-            "logs": self.session_logs
+        fromtimestamp = datetime.datetime.fromtimestamp
+        # Events cluster within the same second, so only format when the second changes
+        last_second = None
+        for ts_ns, step, event, details in map(self._LOG_ENTRY_FIELDS, self.session_logs):
+            second = ts_ns // 1_000_000_000
+            if second != last_second:
+                last_second = second
+                formatted_time = fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            yield f"\n[{formatted_time}] Step {step}: {event}\n"
+            if details is not None:
+                for key, value in details.items():
+                    yield f"  {key}: {value}\n"
+
+    def _stream_logs_as_json(self, fp):
+        """Write logs to a binary file as compact JSON, one entry at a time"""
+        fp.write(b'{"session_start":')
+        fp.write(_json_dumps(self.session_start_time))
+        fp.write(b',"logs":[')
+        for index, entry in enumerate(self.session_logs):
+            if index:
+                fp.write(b",")
+            fp.write(_json_dumps(self._export_entry(entry)))
+        fp.write(b"]}\n")
+
+    def _stream_logs_as_ndjson(self, fp):
+        """Write raw log entries to a binary file as newline-delimited JSON, like the stream"""
+        fp.writelines(_json_dumps(entry) + b"\n" for entry in self.session_logs)
+
+    @staticmethod
+    def _export_entry(entry: dict) -> dict:
+        """Convert a session_logs entry to the shape used in JSON exports"""
+        return {
+            "timestamp": datetime.datetime.fromtimestamp(entry["ts_ns"] / 1e9),
+            "event": entry["event"],
+            "step": entry["step"],
+            "details": entry["details"] or {}
         }
-        return json.dumps(log_data, indent=2)
 
     def display_header(self):
         """Display an attractive header for the automation tool"""
-        header = Panel(
-            "[bold blue]🤖 Interactive Automation Assistant[/]\n"
-            "[dim]Human-in-the-loop process automation[/]",
-            box=box.DOUBLE,
-            style="bold white on blue",
-            padding=(1, 2)
-        )
-        self.console.print(header)
+        self._render(self._header_panel, "header")
         self.log_event("Header displayed")
 
     def create_step_panel(self, step: Dict) -> Panel:
         """Create a visually appealing panel for the current step"""
+        key = (id(step), step['title'], step['description'], step['status'], self.current_step)
+        panel = self._panel_cache.get(key)
+        if panel is not None:
+            return panel
         content = f"""[bold]{step['title']}[/]
         
 [dim]Description:[/] {step['description']}
@@ -188,29 +441,60 @@ class AutomationUI:
 [yellow]Current Status:[/] {step['status']}
 [dim]─────────────────────────────────[/]
 """
-        return Panel(
+        panel = self._panel_cache[key] = Panel(
             content,
             title=f"[bold cyan]Step {self.current_step + 1}[/]",
             border_style="cyan",
             padding=(1, 2)
         )
+        return panel
 
     def display_progress(self, description: str):
         """Show an animated progress indicator with status"""
-        self.log_event("Progress started", {"description": description})
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
-            progress.add_task(description, total=None)
-            # Simulation of process running
-            time.sleep(2)
-        self.log_event("Progress completed", {"description": description})
+        start_ns = time.time_ns()
+        if self._live is not None:
+            # Progress would start a second live display, so animate a spinner in place
+            self._layout["output"].update(Spinner("dots", text=description, style="progress.spinner"))
+            interrupted = self._wait_for_stop(2)
+            self._layout["output"].update("")
+        else:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                refresh_per_second=4,  # Enough for a spinner; the default 10 just burns CPU
+                transient=True,
+            ) as progress:
+                progress.add_task(description, total=None)
+                # Simulation of process running
+                interrupted = self._wait_for_stop(2)
+        # One entry per run rather than separate started/completed events; logged
+        # before cleanup runs even when cut short, so it still reaches the stream
+        self.log_event("Progress completed", {
+            "description": description,
+            "duration_ms": (time.time_ns() - start_ns) // 1_000_000,
+            "interrupted": interrupted
+        })
 
     def display_help(self, step: Dict):
         """Show contextual help in an informative panel"""
         self.log_event("Help displayed", {"step_title": step['title']})
+        key = (id(step), step['title'], step['help_text'], step['common_issues'], self.current_step)
+        help_panel = self._help_cache.get(key)
+        if help_panel is None:
+            help_panel = self._help_cache[key] = self._create_help_panel(step)
+        if self._live is None:
+            self.console.print(help_panel)
+            return
+        # Help is taller than the output region, so show it on the normal screen
+        with self._live_paused():
+            self.console.print(help_panel)
+            self.console.print("[dim]Press any key to return[/]")
+            self.wait_for_keypress()
+
+    def _create_help_panel(self, step: Dict) -> Panel:
+        """Build the help panel for a step, parsing its Markdown content"""
+        from rich.markdown import Markdown
         help_content = f"""
 # Help for Step {self.current_step + 1}: {step['title']}
 
@@ -219,53 +503,48 @@ class AutomationUI:
 ## Common Issues:
 {step['common_issues']}
         """
-        help_panel = Panel(
+        return Panel(
             Markdown(help_content),
             title="[bold blue]Help & Troubleshooting[/]",
             border_style="blue",
             padding=(1, 2)
         )
-        self.console.print(help_panel)
 
-    def show_action_menu(self) -> str:
-        """Display an intuitive action menu for the current step"""
-        table = Table(show_header=False, box=box.SIMPLE)
-        table.add_column("Action", style="cyan")
-        table.add_column("Description", style="dim")
-        
-        actions = [
-            ("▶️ [green]proceed", "Continue to next step (Enter)"),
-            ("🔄 [yellow]retry", "Retry current step (r)"),
-            ("❓ [blue]help", "Get help with current step (h)"),
-            ("📝 [magenta]logs", "Export session logs (l)"),
-            ("❌ [bold red]exit", "Exit automation (q)")
-        ]
-        
-        for action, desc in actions:
-            table.add_row(action, desc)
-            
-        self.console.print(table)
+    def show_action_menu(self) -> Optional[str]:
+        """Display an intuitive action menu for the current step, or return None on shutdown"""
+        self._render(self._action_menu_table, "menu")
         
-        # Wait for valid input
-        while True:
-            action = self.check_keyboard_input()
+        # Wait for valid input, rechecking for shutdown between bounded waits
+        while not self._stop_event.is_set():
+            action = self.check_keyboard_input(timeout_ms=INPUT_WAIT_MS)
             if action:
                 self.log_event("Action selected", {"action": action})
                 return action
-            time.sleep(0.1)  # Small delay to prevent CPU spinning
+        return None
 
     def run_step(self, step: Dict) -> bool:
         """Execute a single step of the automation with user interaction"""
-        self.console.clear()
-        self.display_header()
-        
-        self.log_event("Step started", {
-            "step_title": step['title'],
-            "step_status": step['status']
-        })
-        
-        # Show step information
-        self.console.print(self.create_step_panel(step))
+        # Hold console output until the block exits so the redraw is written in one go
+        with self.console:
+            if self._live is None:
+                self.console.clear()
+            else:
+                self._layout["output"].update("")  # Drop the previous step's messages
+            self.display_header()
+            
+            self.log_event("Step started", {
+                "step_title": step['title'],
+                "step_status": step['status']
+            })
+            
+            # Show step information
+            step_panel = self.create_step_panel(step)
+            if self._live is not None:
+                # Fit the region to the panel so a wrapped description doesn't clip its border
+                self._layout["step"].size = len(self.console.render_lines(
+                    step_panel, self.console.options.update(height=None), pad=False
+                ))
+            self._render(step_panel, "step")
         
         # Show progress animation
         self.display_progress(f"Running {step['title']}...")
@@ -273,7 +552,9 @@ class AutomationUI:
         while True:
             action = self.show_action_menu()
             
-            if action == "proceed":
+            if action is None:  # Shutting down after an interrupt
+                return False
+            elif action == "proceed":
                 self.print_message(f"Step '{step['title']}' completed", "success")
                 self.log_event("Step completed", {"step_title": step['title']})
                 return True
@@ -286,8 +567,10 @@ class AutomationUI:
             elif action == "logs":
                 self.show_export_options()
             elif action == "exit":
-                if Confirm.ask("[bold red]Are you sure you want to exit?"):
-                    self.print_message("Session terminated by user", "warning")
+                from rich.prompt import Confirm
+                with self._live_paused():
+                    confirmed = Confirm.ask("[bold red]Are you sure you want to exit?")
+                if confirmed:
                     self.log_event("Session terminated by user")
                     return False
 
@@ -295,26 +578,39 @@ class AutomationUI:
         """Main loop for running the automation process"""
         try:
             self.show_keyboard_shortcuts()  # Show available shortcuts at start
-            time.sleep(2)  # Give user time to read shortcuts
+            self.wait_for_keypress(2)  # Give user time to read shortcuts
             
-            while self.current_step < len(steps) and self.is_running:
-                step = steps[self.current_step]
-                if self.run_step(step):
-                    self.current_step += 1
-                else:
-                    break
-                    
-            if self.current_step >= len(steps):
+            if self.is_running:  # Skip the alternate screen if interrupted during the pause
+                with Live(self._layout, console=self.console, screen=True, refresh_per_second=10) as live:
+                    self._live = live
+                    try:
+                        while self.current_step < len(steps) and self.is_running:
+                            step = steps[self.current_step]
+                            if self.run_step(step):
+                                self.current_step += 1
+                            else:
+                                break
+                    finally:
+                        self._live = None
+            
+            # Final messages, including cleanup's, go to the normal screen; the live
+            # display's screen is gone
+            if self.current_step < len(steps):
+                if self.is_running:  # Left via the exit action rather than an interrupt
+                    self.print_message("Session terminated by user", "warning")
+            else:
                 self.log_event("Automation completed", {
                     "total_steps": len(steps)
                 })
-                self.print_message("🎉 Automation completed successfully!", "success")
-                self.console.print(Panel(
-                    f"[dim]Total steps completed: {len(steps)}[/]",
-                    style="bold white on green",
-                    padding=(1, 2)
-                ))
+                with self.console:
+                    self.print_message("🎉 Automation completed successfully!", "success")
+                    self.console.print(Panel(
+                        f"[dim]Total steps completed: {len(steps)}[/]",
+                        style="bold white on green",
+                        padding=(1, 2)
+                    ))
                 
+                from rich.prompt import Confirm
                 if Confirm.ask("[cyan]Would you like to export the session logs?"):
                     self.show_export_options()
                 